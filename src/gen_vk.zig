@@ -53,13 +53,12 @@ pub fn main() !void {
 
 const Writer = struct {
     writer: std.fs.File.Writer,
-    alloc: Allocator,
 
     const Self = @This();
     pub fn init(alloc: Allocator, file: std.fs.File) !Self {
-        const buffer = try alloc.alloc(u8, 4096 * 12);
+        const buffer = try alloc.alloc(u8, 1024 * 1024);
         const writer = file.writer(buffer);
-        const result: Self = .{ .writer = writer, .alloc = alloc };
+        const result: Self = .{ .writer = writer };
         return result;
     }
 
@@ -68,9 +67,7 @@ const Writer = struct {
     }
 
     fn write(self: *Self, comptime fmt: []const u8, args: anytype) void {
-        const line = std.fmt.allocPrint(self.alloc, fmt, args) catch unreachable;
-        defer self.alloc.free(line);
-        _ = self.writer.interface.write(line) catch unreachable;
+        self.writer.interface.print(fmt, args) catch unreachable;
     }
 
     fn write_comment(self: *Self, comment: []const u8, line_start: []const u8) void {
@@ -79,9 +76,7 @@ const Writer = struct {
             const trimmed_line = std.mem.trimStart(u8, line, " ");
             if (trimmed_line.len == 0) break;
 
-            _ = self.writer.interface.write(line_start) catch unreachable;
-            _ = self.writer.interface.write(trimmed_line) catch unreachable;
-            _ = self.writer.interface.write("\n") catch unreachable;
+            self.write("{s}{s}\n", .{ line_start, trimmed_line });
         }
     }
 };
@@ -328,14 +323,10 @@ fn write_structs(alloc: Allocator, w: *Writer, type_db: *TypeDatabase) !void {
             for (@"struct".extends, 0..) |e, i| {
                 const t = type_db.get_type(e);
                 const s = type_db.get_struct(t.struct_idx());
+                const separator: []const u8 = if (i != @"struct".extends.len - 1) "," else "";
                 w.write(
-                    \\{s}
-                , .{s.name});
-                if (i != @"struct".extends.len - 1) {
-                    w.write(
-                        \\,
-                    , .{});
-                }
+                    \\{s}{s}
+                , .{ s.name, separator });
             }
             w.write(
                 \\
@@ -44,13 +44,12 @@ pub fn main() !void {
 
 const Writer = struct {
     writer: std.fs.File.Writer,
-    alloc: Allocator,
 
     const Self = @This();
     pub fn init(alloc: Allocator, file: std.fs.File) !Self {
-        const buffer = try alloc.alloc(u8, 4096 * 12);
+        const buffer = try alloc.alloc(u8, 1024 * 1024);
         const writer = file.writer(buffer);
-        const result: Self = .{ .writer = writer, .alloc = alloc };
+        const result: Self = .{ .writer = writer };
         return result;
     }
 
@@ -59,9 +58,7 @@ const Writer = struct {
     }
 
     fn write(self: *Self, comptime fmt: []const u8, args: anytype) void {
-        const line = std.fmt.allocPrint(self.alloc, fmt, args) catch unreachable;
-        defer self.alloc.free(line);
-        _ = self.writer.interface.write(line) catch unreachable;
+        self.writer.interface.print(fmt, args) catch unreachable;
     }
 };
 
@@ -366,16 +363,11 @@ fn write_print_struct(alloc: Allocator, w: *Writer, type_db: *const TypeDatabase
                     else => {},
                 }
             } else {
-                const field_name = try std.fmt.allocPrint(
-                    alloc,
-                    "packed_field{d}",
-                    .{packed_fields},
-                );
                 w.write(
                     \\    for (0..offset + 1) |_| log.output("    ", .{{}});
-                    \\    log.output("{[field_name]s}: <packed> = {{any}},\n", .{{value.{[field_name]s}}});
+                    \\    log.output("packed_field{[idx]d}: <packed> = {{any}},\n", .{{value.packed_field{[idx]d}}});
                     \\
-                , .{ .field_name = field_name });
+                , .{ .idx = packed_fields });
                 packed_fields += 1;
             }
         }
@@ -46,19 +46,18 @@ pub fn main() !void {
     try write_additional_types(tmp_alloc, &writer, &type_db);
     _ = tmp_arena.reset(.retain_capacity);
     try write_spirv_validation(&writer, &type_db);
-    _ = writer.writer.interface.write(VALIDATE_SHADER_CODE) catch unreachable;
-    _ = writer.writer.interface.write(VALIDATION_STRUCT) catch unreachable;
+    writer.writer.interface.writeAll(VALIDATE_SHADER_CODE) catch unreachable;
+    writer.writer.interface.writeAll(VALIDATION_STRUCT) catch unreachable;
 }
 
 const Writer = struct {
     writer: std.fs.File.Writer,
-    alloc: Allocator,
 
     const Self = @This();
     pub fn init(alloc: Allocator, file: std.fs.File) !Self {
-        const buffer = try alloc.alloc(u8, 4096 * 12);
+        const buffer = try alloc.alloc(u8, 1024 * 1024);
         const writer = file.writer(buffer);
-        const result: Self = .{ .writer = writer, .alloc = alloc };
+        const result: Self = .{ .writer = writer };
         return result;
     }
 
@@ -67,9 +66,7 @@ const Writer = struct {
     }
 
     fn write(self: *Self, comptime fmt: []const u8, args: anytype) void {
-        const line = std.fmt.allocPrint(self.alloc, fmt, args) catch unreachable;
-        defer self.alloc.free(line);
-        _ = self.writer.interface.write(line) catch unreachable;
+        self.writer.interface.print(fmt, args) catch unreachable;
     }
 };
 
@@ -163,18 +160,17 @@ fn vk_version_to_api_version(s: []const u8) ?[]const u8 {
 // ((VK_KHR_get_physical_device_properties2,VK_VERSION_1_1)+VK_KHR_dynamic_rendering),VK_VERSION_1_3
 // into:
 // ((self.instance.VK_KHR_get_physical_device_properties2 or vk.VK_API_VERSION_1_1 <= api_version) and self.device.VK_KHR_dynamic_rendering) or vk.VK_API_VERSION_1_3 <= api_version
-fn write_depends(alloc: Allocator, w: *Writer, instance_extensions: []*const TypeDatabase.Extension, depends: []const u8) !void {
+fn write_depends(w: *Writer, instance_extensions: []*const TypeDatabase.Extension, depends: []const u8) !void {
     w.write(" and (", .{});
-    var output: std.ArrayListUnmanaged(u8) = .empty;
-    var writer = output.writer(alloc);
+    const writer = &w.writer.interface;
     var i: usize = 0;
     while (i < depends.len) : (i += 1) {
         const c = depends[i];
         switch (c) {
-            '(' => _ = try writer.write("("),
-            ')' => _ = try writer.write(")"),
-            ',' => _ = try writer.write(" or "),
-            '+' => _ = try writer.write(" and "),
+            '(' => try writer.writeAll("("),
+            ')' => try writer.writeAll(")"),
+            ',' => try writer.writeAll(" or "),
+            '+' => try writer.writeAll(" and "),
             else => {
                 if (vk_version_to_api_version(depends[i..])) |version| {
                     try writer.print("!api_version.less(vk.{s})", .{version});
@@ -207,7 +203,7 @@ fn write_depends(alloc: Allocator, w: *Writer, instance_extensions: []*const Typ
             },
         }
     }
-    w.write("{s})", .{output.items});
+    w.write(")", .{});
 }
 
 fn write_extension_type(alloc: Allocator, w: *Writer, type_db: *const TypeDatabase) !void {
@@ -310,7 +306,7 @@ fn write_extension_type(alloc: Allocator, w: *Writer, type_db: *const TypeDataba
                 \\        for (ie) |ext| {{
                 \\            if (std.mem.eql(u8, ext, "{s}")
             , .{ext.name});
-            if (ext.depends) |depends| try write_depends(alloc, w, instance_extensions.items, depends);
+            if (ext.depends) |depends| try write_depends(w, instance_extensions.items, depends);
             w.write(
                 \\) {{
                 \\                self.instance.{s} = true;
@@ -331,7 +327,7 @@ fn write_extension_type(alloc: Allocator, w: *Writer, type_db: *const TypeDataba
                 \\        for (de) |ext| {{
                 \\            if (std.mem.eql(u8, ext, "{s}")
             , .{ext.name});
-            if (ext.depends) |depends| try write_depends(alloc, w, instance_extensions.items, depends);
+            if (ext.depends) |depends| try write_depends(w, instance_extensions.items, depends);
             w.write(
                 \\) {{
                 \\                self.device.{s} = true;
@@ -1064,18 +1060,18 @@ const additional_pdfs = [_][]const u8{
     "VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeaturesKHR",
 };
 
-fn gather_features_and_props_struct_names(alloc: Allocator, type_db: *const TypeDatabase) !struct {
-    []const []const u8,
-    []const []const u8,
+fn gather_features_and_props_structs(alloc: Allocator, type_db: *const TypeDatabase) !struct {
+    []const *const TypeDatabase.Struct,
+    []const *const TypeDatabase.Struct,
 } {
-    var features: std.StringArrayHashMapUnmanaged(void) = .empty;
+    var features: std.StringArrayHashMapUnmanaged(*const TypeDatabase.Struct) = .empty;
     for (additional_pdfs) |pdf| {
         const st = type_db.find_base(pdf);
         const t = type_db.get_type_follow_alias(st);
         const s = type_db.get_struct(t.struct_idx());
-        try features.put(alloc, s.name, {});
+        try features.put(alloc, s.name, s);
     }
-    var props: std.StringArrayHashMapUnmanaged(void) = .empty;
+    var props: std.StringArrayHashMapUnmanaged(*const TypeDatabase.Struct) = .empty;
     for (spirv_capabilities) |tuple| {
         const cap_name, const val = tuple;
         _ = val;
@@ -1089,13 +1085,13 @@ fn gather_features_and_props_struct_names(alloc: Allocator, type_db: *const Type
                             const st = type_db.find_base(sfr.@"struct");
                             const t = type_db.get_type_follow_alias(st);
                             const s = type_db.get_struct(t.struct_idx());
-                            try features.put(alloc, s.name, {});
+                            try features.put(alloc, s.name, s);
                         },
                         .property => |prop| {
                             const st = type_db.find_base(prop.property);
                             const t = type_db.get_type_follow_alias(st);
                             const s = type_db.get_struct(t.struct_idx());
-                            try props.put(alloc, s.name, {});
+                            try props.put(alloc, s.name, s);
                         },
                         else => {},
                     }
@@ -1103,20 +1099,17 @@ fn gather_features_and_props_struct_names(alloc: Allocator, type_db: *const Type
             }
         }
     }
-    return .{ features.keys(), props.keys() };
+    return .{ features.values(), props.values() };
 }
 
 fn write_additional_types(alloc: Allocator, w: *Writer, type_db: *const TypeDatabase) !void {
-    const features, const props = try gather_features_and_props_struct_names(alloc, type_db);
+    const features, const props = try gather_features_and_props_structs(alloc, type_db);
     {
         w.write(
             \\pub const AdditionalPDF = struct {{
             \\
         , .{});
-        for (features) |f| {
-            const sti = type_db.find_base(f);
-            const t = type_db.get_type_follow_alias(sti);
-            const s = type_db.get_struct(t.struct_idx());
+        for (features) |s| {
             w.write(
                 \\    {[type]s}: vk.{[type]s} = .{{}},
                 \\
@@ -1131,36 +1124,27 @@ fn write_additional_types(alloc: Allocator, w: *Writer, type_db: *const TypeData
             \\
         , .{});
         var added: std.StringArrayHashMapUnmanaged(void) = .empty;
-        for (features) |f| {
-            const sti = type_db.find_base(f);
-            const t = type_db.get_type_follow_alias(sti);
-            const s = type_db.get_struct(t.struct_idx());
-
-            var valid_extensions: std.ArrayListUnmanaged([]const u8) = .empty;
+        for (features) |s| {
+            var valid_extensions: u32 = 0;
             for (s.enabled_by_extensions) |ext| {
                 if (!std.mem.startsWith(u8, ext, "VK_BASE") and
                     !std.mem.startsWith(u8, ext, "VK_GRAPHICS") and
                     !std.mem.startsWith(u8, ext, "VK_COMPUTE") and
                     !std.mem.startsWith(u8, ext, "VKSC"))
                 {
-                    try added.put(alloc, f, {});
-                    try valid_extensions.append(alloc, ext);
+                    try added.put(alloc, s.name, {});
+                    const prefix: []const u8 = if (valid_extensions == 0)
+                        "            if (("
+                    else
+                        " or\n                ";
+                    w.write(
+                        \\{[prefix]s}std.mem.eql(u8, e, "{[ext]s}")
+                    , .{ .prefix = prefix, .ext = ext });
+                    valid_extensions += 1;
                 }
             }
 
-            if (valid_extensions.items.len != 0) {
-                w.write(
-                    \\            if ((
-                , .{});
-                for (valid_extensions.items, 0..) |ext, i| {
-                    w.write(
-                        \\std.mem.eql(u8, e, "{[ext]s}")
-                    , .{ .ext = ext });
-                    if (i != valid_extensions.items.len - 1) w.write(
-                        \\ or
-                        \\                
-                    , .{});
-                }
+            if (valid_extensions != 0) {
                 w.write(
                     \\) and pdf.{[type]s}.pNext == null)
                     \\            {{
@@ -1176,13 +1160,13 @@ fn write_additional_types(alloc: Allocator, w: *Writer, type_db: *const TypeData
             \\        }}
             \\
         , .{});
-        for (features) |f| {
-            if (added.get(f) == null) {
+        for (features) |s| {
+            if (added.get(s.name) == null) {
                 w.write(
                     \\        pdf.{[type]s}.pNext = pnext;
                     \\        pnext = &pdf.{[type]s};
                     \\
-                , .{ .type = f });
+                , .{ .type = s.name });
             }
         }
         w.write(
@@ -1198,11 +1182,11 @@ fn write_additional_types(alloc: Allocator, w: *Writer, type_db: *const TypeData
             \\pub const AdditionalProperties = struct {{
             \\
         , .{});
-        for (props) |p| {
+        for (props) |s| {
             w.write(
                 \\    {[type]s}: vk.{[type]s} = .{{}},
                 \\
-            , .{ .type = p });
+            , .{ .type = s.name });
         }
         w.write(
             \\
@@ -1214,37 +1198,28 @@ fn write_additional_types(alloc: Allocator, w: *Writer, type_db: *const TypeData
         , .{});
         var used_e: bool = false;
         var added: std.StringArrayHashMapUnmanaged(void) = .empty;
-        for (props) |p| {
-            const sti = type_db.find_base(p);
-            const t = type_db.get_type_follow_alias(sti);
-            const s = type_db.get_struct(t.struct_idx());
-
-            var valid_extensions: std.ArrayListUnmanaged([]const u8) = .empty;
+        for (props) |s| {
+            var valid_extensions: u32 = 0;
             for (s.enabled_by_extensions) |ext| {
                 if (!std.mem.startsWith(u8, ext, "VK_BASE") and
                     !std.mem.startsWith(u8, ext, "VK_GRAPHICS") and
                     !std.mem.startsWith(u8, ext, "VK_COMPUTE") and
                     !std.mem.startsWith(u8, ext, "VKSC"))
                 {
-                    try added.put(alloc, p, {});
-                    try valid_extensions.append(alloc, ext);
+                    try added.put(alloc, s.name, {});
                     used_e = true;
+                    const prefix: []const u8 = if (valid_extensions == 0)
+                        "            if (("
+                    else
+                        " or\n                ";
+                    w.write(
+                        \\{[prefix]s}std.mem.eql(u8, e, "{[ext]s}")
+                    , .{ .prefix = prefix, .ext = ext });
+                    valid_extensions += 1;
                 }
             }
 
-            if (valid_extensions.items.len != 0) {
-                w.write(
-                    \\            if ((
-                , .{});
-                for (valid_extensions.items, 0..) |ext, i| {
-                    w.write(
-                        \\std.mem.eql(u8, e, "{[ext]s}")
-                    , .{ .ext = ext });
-                    if (i != valid_extensions.items.len - 1) w.write(
-                        \\ or
-                        \\                
-                    , .{});
-                }
+            if (valid_extensions != 0) {
                 w.write(
                     \\) and pdf.{[type]s}.pNext == null)
                     \\            {{
@@ -1265,13 +1240,13 @@ fn write_additional_types(alloc: Allocator, w: *Writer, type_db: *const TypeData
             \\        }}
             \\
         , .{});
-        for (props) |p| {
-            if (added.get(p) == null) {
+        for (props) |s| {
+            if (added.get(s.name) == null) {
                 w.write(
                     \\        pdf.{[type]s}.pNext = pnext;
                     \\        pnext = &pdf.{[type]s};
                     \\
-                , .{ .type = p });
+                , .{ .type = s.name });
             }
         }
         w.write(
@@ -1366,12 +1341,12 @@ fn write_spirv_validation(w: *Writer, type_db: *const TypeDatabase) !void {
                                     w.write(
                                         \\            if (validation.additional_properties.{[str]s}.{[field]s}.{[value]s}) return true;
                                         \\
-                                    , .{ .str = prop.property, .field = prop.member, .value = prop.value });
+                                    , .{ .str = s.name, .field = prop.member, .value = prop.value });
                                 } else {
                                     w.write(
                                         \\            if (validation.additional_properties.{[str]s}.{[field]s} == vk.{[value]s}) return true;
                                         \\
-                                    , .{ .str = prop.property, .field = prop.member, .value = prop.value });
+                                    , .{ .str = s.name, .field = prop.member, .value = prop.value });
                                 }
                                 // TODO: add `requires` checks as well
                             },